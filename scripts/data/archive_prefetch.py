@@ -0,0 +1,354 @@
+"""Overlap 7z decompression with CSV decoding through a bounded prefetch queue.
+
+``py7zr`` decompresses on a producer thread and queues the chunks it writes
+as-is, without re-slicing or copying them. The consumer decodes each completed
+chunk to text and feeds whole lines to the CSV reader while the next chunks are
+being inflated. LZMA releases the GIL while it works, so with a spare CPU core
+decompression runs alongside parsing; on a single core the two only interleave
+and the reader is no faster than decompress-then-parse, but its memory stays
+bounded. ``python scripts/data/archive_prefetch.py ARCHIVE`` times both paths.
+The queue is bounded both by bytes (``buffer_size``) and by
+chunk count (``queue_depth``); once either limit is reached the producer blocks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import codecs
+import csv
+import io
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+try:
+    import py7zr
+    from py7zr.io import BytesIOFactory, Py7zIO, WriterFactory
+except ImportError:  # pragma: no cover - optional dependency
+    py7zr = None
+    Py7zIO = WriterFactory = object  # type: ignore[misc, assignment]
+
+DEFAULT_BUFFER_SIZE = 16 << 20
+DEFAULT_QUEUE_DEPTH = 256
+# How often a blocked producer re-checks whether the consumer has gone away.
+_WAIT_TIMEOUT = 0.1
+
+_EOF = object()
+
+
+class ArchivePrefetchError(RuntimeError):
+    """Raised when the archive cannot be opened or decompression fails."""
+
+
+class _Cancelled(Exception):
+    """Unwinds the producer once the consumer stops reading."""
+
+
+class PrefetchBuffer:
+    """Byte-bounded queue of decompressed chunks shared by one producer and one consumer."""
+
+    def __init__(
+        self, buffer_size: int = DEFAULT_BUFFER_SIZE, queue_depth: int = DEFAULT_QUEUE_DEPTH
+    ) -> None:
+        if buffer_size <= 0 or queue_depth <= 0:
+            raise ValueError("buffer_size and queue_depth must be positive")
+        self.buffer_size = buffer_size
+        self.queue_depth = queue_depth
+        self._chunks: deque[object] = deque()
+        self._buffered = 0
+        self._cancelled = False
+        self._condition = threading.Condition()
+        # Set by run_producer() so a consumer never waits on a thread that has died.
+        self.producer: threading.Thread | None = None
+
+    # Producer side -----------------------------------------------------------------
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        """Queue one decompressed chunk, blocking while the queue is full."""
+
+        size = len(data)
+        if size:
+            # py7zr hands over a fresh object per chunk; only mutable views need a copy.
+            self._put(data if isinstance(data, bytes) else bytes(data), size)
+        return size
+
+    def finish(self) -> None:
+        """Signal end of stream."""
+
+        self._put(_EOF, 0)
+
+    def fail(self, exc: BaseException) -> None:
+        """Forward a producer error to the consumer."""
+
+        try:
+            self._put(exc, 0)
+        except _Cancelled:
+            pass
+
+    def _put(self, item: object, size: int) -> None:
+        with self._condition:
+            # An oversized chunk is still admitted into an empty queue so it cannot deadlock.
+            while self._chunks and (
+                self._buffered + size > self.buffer_size or len(self._chunks) >= self.queue_depth
+            ):
+                if self._cancelled:
+                    raise _Cancelled
+                self._condition.wait(_WAIT_TIMEOUT)
+            if self._cancelled:
+                raise _Cancelled
+            self._chunks.append(item)
+            self._buffered += size
+            self._condition.notify_all()
+
+    # Consumer side -----------------------------------------------------------------
+
+    def get(self) -> bytes | None:
+        """Return the next chunk, or ``None`` at end of stream."""
+
+        with self._condition:
+            while not self._chunks:
+                if self.producer is not None and not self.producer.is_alive():
+                    raise ArchivePrefetchError("Archive producer stopped before end of stream")
+                self._condition.wait(_WAIT_TIMEOUT)
+            item = self._chunks.popleft()
+            if isinstance(item, bytes):
+                self._buffered -= len(item)
+            self._condition.notify_all()
+        if item is _EOF:
+            return None
+        if isinstance(item, BaseException):
+            raise ArchivePrefetchError(str(item)) from item
+        return item  # type: ignore[return-value]
+
+    def chunks(self) -> Iterator[bytes]:
+        """Yield queued chunks until the producer finishes."""
+
+        while True:
+            chunk = self.get()
+            if chunk is None:
+                return
+            yield chunk
+
+    def cancel(self) -> None:
+        """Stop the producer and release any chunks it queued."""
+
+        with self._condition:
+            self._cancelled = True
+            self._chunks.clear()
+            self._buffered = 0
+            self._condition.notify_all()
+
+
+def iter_text_lines(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[str]:
+    """Decode byte chunks into lines (newlines kept) for ``csv.reader``.
+
+    Each chunk is decoded once and split only at its last newline, so multi-byte
+    characters and lines that straddle chunk boundaries are carried forward intact.
+    """
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    tail = ""
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        cut = text.rfind("\n") + 1
+        if not cut:
+            tail += text
+            continue
+        yield from io.StringIO(tail + text[:cut], newline="")
+        tail = text[cut:]
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def run_producer(
+    produce: Callable[[PrefetchBuffer], None],
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    queue_depth: int = DEFAULT_QUEUE_DEPTH,
+) -> tuple[PrefetchBuffer, threading.Thread]:
+    """Start ``produce`` on a daemon thread writing into a fresh :class:`PrefetchBuffer`."""
+
+    buffer = PrefetchBuffer(buffer_size, queue_depth)
+
+    def _target() -> None:
+        try:
+            produce(buffer)
+            buffer.finish()
+        except _Cancelled:
+            pass
+        except BaseException as exc:  # surfaced to the consumer as ArchivePrefetchError
+            buffer.fail(exc)
+
+    thread = threading.Thread(target=_target, name="archive-prefetch", daemon=True)
+    buffer.producer = thread
+    thread.start()
+    return buffer, thread
+
+
+class _MemberWriter(Py7zIO):
+    """``py7zr`` sink forwarding one archive member into the prefetch buffer."""
+
+    def __init__(self, buffer: PrefetchBuffer) -> None:
+        self._buffer = buffer
+        self._written = 0
+
+    def write(self, s: bytes | bytearray) -> int:
+        self._written += len(s)
+        return self._buffer.write(s)
+
+    def read(self, size: int | None = None) -> bytes:
+        return b""
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._written
+
+    def flush(self) -> None:
+        return None
+
+    def size(self) -> int:
+        return self._written
+
+
+class _MemberWriterFactory(WriterFactory):
+    def __init__(self, buffer: PrefetchBuffer) -> None:
+        self._buffer = buffer
+
+    def create(self, filename: str) -> Py7zIO:
+        return _MemberWriter(self._buffer)
+
+
+def _resolve_member(archive, member: str | None) -> str:
+    names = archive.getnames()
+    if member is not None:
+        if member not in names:
+            raise ArchivePrefetchError(f"{member} not found in archive")
+        return member
+    for name in names:
+        if name.lower().endswith(".csv"):
+            return name
+    raise ArchivePrefetchError("Archive does not contain a CSV member")
+
+
+def _open_member(archive_path: Path, member: str | None):
+    """Open ``archive_path`` and resolve ``member``; the caller must close the archive."""
+
+    if py7zr is None:
+        raise ArchivePrefetchError("py7zr is required to stream 7z archives")
+
+    try:
+        archive = py7zr.SevenZipFile(archive_path, mode="r")
+    except (OSError, py7zr.Bad7zFile) as exc:
+        raise ArchivePrefetchError(f"Unable to open {archive_path}: {exc}") from exc
+
+    try:
+        return archive, _resolve_member(archive, member)
+    except ArchivePrefetchError:
+        archive.close()
+        raise
+
+
+def _check_member(archive_path: Path, member: str | None) -> str:
+    # Resolve eagerly so opening errors surface at call time; the row generator
+    # reopens the archive itself, so an iterator that is never started holds no handle.
+    archive, target = _open_member(archive_path, member)
+    archive.close()
+    return target
+
+
+def iter_prefetched_csv_rows(
+    archive_path: Path,
+    member: str | None = None,
+    *,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    queue_depth: int = DEFAULT_QUEUE_DEPTH,
+) -> Iterator[dict[str, str]]:
+    """Stream CSV rows from a 7z member while it is decompressed on another thread.
+
+    Rows match what ``csv.DictReader`` yields for the decompressed member. Opening
+    errors are raised eagerly; closing the returned iterator early cancels the producer and stops
+    decompression.
+    """
+
+    target = _check_member(archive_path, member)
+    return _iter_rows(archive_path, target, buffer_size, queue_depth)
+
+
+def _iter_rows(
+    archive_path: Path, target: str, buffer_size: int, queue_depth: int
+) -> Iterator[dict[str, str]]:
+    archive, _ = _open_member(archive_path, target)
+
+    def _produce(buffer: PrefetchBuffer) -> None:
+        try:
+            archive.extract(targets=[target], factory=_MemberWriterFactory(buffer))
+        finally:
+            archive.close()
+
+    buffer, thread = run_producer(_produce, buffer_size, queue_depth)
+    try:
+        yield from csv.DictReader(iter_text_lines(buffer.chunks()))
+    finally:
+        buffer.cancel()
+        thread.join()
+
+
+def _iter_serial_rows(archive_path: Path, member: str | None) -> Iterator[dict[str, str]]:
+    """Decompress the whole member into memory, then parse it (the benchmark baseline)."""
+
+    archive, target = _open_member(archive_path, member)
+    factory = BytesIOFactory(1 << 40)
+    with archive:
+        archive.extract(targets=[target], factory=factory)
+    product = factory.products[target]
+    product.seek(0)
+    text = io.TextIOWrapper(io.BytesIO(product.read()), encoding="utf-8", newline="")
+    yield from csv.DictReader(text)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time serial decompress-then-parse against the prefetching reader."
+    )
+    parser.add_argument("archive", type=Path, help="7z archive containing a CSV member")
+    parser.add_argument("--member", default=None, help="CSV member to read (default: first .csv)")
+    parser.add_argument(
+        "--buffer-size",
+        type=int,
+        default=DEFAULT_BUFFER_SIZE,
+        help="Maximum decompressed bytes held in the queue (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=DEFAULT_QUEUE_DEPTH,
+        help="Maximum chunks held in the queue (default: %(default)s)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    timings = {}
+    for label, rows in (
+        ("serial", lambda: _iter_serial_rows(args.archive, args.member)),
+        (
+            "prefetch",
+            lambda: iter_prefetched_csv_rows(
+                args.archive,
+                args.member,
+                buffer_size=args.buffer_size,
+                queue_depth=args.queue_depth,
+            ),
+        ),
+    ):
+        started = time.perf_counter()
+        count = sum(1 for _ in rows())
+        timings[label] = time.perf_counter() - started
+        print(f"{label:>8}: {count} rows in {timings[label]:.2f}s")
+    print(f"speedup: {timings['serial'] / timings['prefetch']:.2f}x")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
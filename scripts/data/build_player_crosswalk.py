@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""Link PlayerStatistics ``personId`` values to sports-reference catalog slugs."""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Compute repository root and enable first-party imports.
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from scripts.data.row_projection import season_start_from_date  # noqa: E402
+
+INDEX_PATH = ROOT / "public" / "data" / "players_index.json"
+PLAYERS_DIR = ROOT / "public" / "data" / "players"
+OUTPUT_PATH = ROOT / "public" / "data" / "player_crosswalk.json"
+
+# Weighted blend of name similarity and a team/season agreement bonus.
+NAME_WEIGHT = 0.8
+TEAM_WEIGHT = 0.2
+MATCH_THRESHOLD = 0.8
+# Minimum lead over the runner-up before a match is considered unambiguous.
+MATCH_MARGIN = 0.05
+PREFIX_LENGTH = 4
+
+_SUFFIX_PATTERN = re.compile(r"\b(jr|sr|ii|iii|iv|v)\b")
+_NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]")
+_TEAM_NOISE_PATTERN = re.compile(r"men's|mens|women's|womens|\b(men|women|basketball)\b")
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+BlockKey = Tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """A single (player, team, season) record from the sports-reference catalog."""
+
+    slug: str
+    name_key: str
+    last_key: str
+    team_key: str
+    season_year: int
+
+
+@dataclass
+class ArchiveIdentity:
+    """Distinct player identity observed in the PlayerStatistics archive."""
+
+    person_id: int
+    name_key: str = ""
+    last_key: str = ""
+    appearances: Set[Tuple[int, str]] = field(default_factory=set)
+
+
+@dataclass(frozen=True)
+class CrosswalkMatch:
+    person_id: int
+    slug: str
+    score: float
+
+
+def _fold(value: str | None) -> str:
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    return decomposed.encode("ascii", "ignore").decode("ascii").lower()
+
+
+def normalise_name(value: str | None) -> str:
+    """Mirror ``normaliseName`` from ``scripts/scrape/cbb_index.ts`` with accent folding."""
+
+    text = _fold(value).replace("&", "and")
+    text = _SUFFIX_PATTERN.sub("", text)
+    return _NON_ALNUM_PATTERN.sub("", text)
+
+
+def normalise_team(value: str | None) -> str:
+    """Mirror ``normaliseTeam`` from ``scripts/scrape/cbb_index.ts``."""
+
+    text = _fold(value).replace("&", "and")
+    text = _TEAM_NOISE_PATTERN.sub("", text)
+    return _NON_ALNUM_PATTERN.sub("", text)
+
+
+def soundex(value: str) -> str:
+    """Return the American Soundex code for an already normalised name."""
+
+    letters = [char for char in value if char.isalpha()]
+    if not letters:
+        return ""
+    first = letters[0]
+    code = [first.upper()]
+    previous = _SOUNDEX_CODES.get(first, "")
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code.append(digit)
+            if len(code) == 4:
+                break
+        # ``h`` and ``w`` do not separate letters sharing a code; vowels do.
+        if char not in "hw":
+            previous = digit
+    return "".join(code).ljust(4, "0")
+
+
+def _season_label_year(label: str | None) -> int | None:
+    """Convert ``2024-25`` into the catalog's ``season_year`` (2025)."""
+
+    if not label:
+        return None
+    start, *_ = label.split("-", 1)
+    try:
+        return int(start) + 1
+    except ValueError:
+        return None
+
+
+def _season_year_from_date(date_str: str | None) -> int | None:
+    """Convert an archive ``gameDate`` into the catalog's ``season_year`` (end year)."""
+
+    start = season_start_from_date(date_str)
+    return start + 1 if start is not None else None
+
+
+def _block_keys(name_key: str, last_key: str, team_key: str, season_year: int) -> List[BlockKey]:
+    keys: List[BlockKey] = []
+    if team_key:
+        keys.append(("team", team_key, season_year))
+    if name_key:
+        keys.append(("prefix", name_key[:PREFIX_LENGTH], season_year))
+    phonetic = soundex(last_key)
+    if phonetic and name_key:
+        keys.append(("phonetic", f"{name_key[0]}{phonetic}", season_year))
+    return keys
+
+
+def _catalog_entry(slug: str, name: str, team: str | None, season_year: int | None) -> CatalogEntry | None:
+    name_key = normalise_name(name)
+    if not slug or not name_key or season_year is None:
+        return None
+    # Skip trailing suffixes such as "Jr." so the phonetic block uses the surname.
+    last_key = next(
+        (key for key in map(normalise_name, reversed(name.split())) if key), ""
+    )
+    return CatalogEntry(
+        slug=slug,
+        name_key=name_key,
+        last_key=last_key,
+        team_key=normalise_team(team),
+        season_year=season_year,
+    )
+
+
+def load_catalog(index_path: Path = INDEX_PATH, players_dir: Path = PLAYERS_DIR) -> List[CatalogEntry]:
+    """Collect catalog records from the players index and per-player season files."""
+
+    entries: Set[CatalogEntry] = set()
+
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        index = {}
+    for player in index.get("players", []):
+        if not isinstance(player, dict):
+            continue
+        season_year = player.get("season_year")
+        if not isinstance(season_year, int):
+            season_year = _season_label_year(player.get("season"))
+        entry = _catalog_entry(
+            str(player.get("slug") or ""),
+            str(player.get("name") or ""),
+            player.get("team"),
+            season_year,
+        )
+        if entry:
+            entries.add(entry)
+
+    for path in players_dir.glob("*.json"):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        seasons = data.get("seasons")
+        if not isinstance(seasons, list):
+            continue
+        slug = str(data.get("slug") or path.stem)
+        name = str(data.get("name") or "")
+        for season in seasons:
+            if not isinstance(season, dict):
+                continue
+            entry = _catalog_entry(
+                slug, name, season.get("team"), _season_label_year(season.get("season"))
+            )
+            if entry:
+                entries.add(entry)
+
+    return sorted(entries, key=lambda item: (item.slug, item.season_year, item.team_key))
+
+
+def collect_archive_identities(rows: Iterable[dict[str, str]]) -> Dict[int, ArchiveIdentity]:
+    """Reduce archive rows to one identity per ``personId`` with its team/season appearances."""
+
+    identities: Dict[int, ArchiveIdentity] = {}
+    for row in rows:
+        try:
+            person_id = int(float(row.get("personId") or ""))
+        except (ValueError, OverflowError):
+            continue
+        if person_id <= 0:
+            continue
+
+        identity = identities.get(person_id)
+        if identity is None:
+            identity = ArchiveIdentity(person_id=person_id)
+            identities[person_id] = identity
+        if not identity.name_key:
+            first_name = row.get("firstName") or ""
+            last_name = row.get("lastName") or ""
+            identity.name_key = normalise_name(f"{first_name} {last_name}")
+            identity.last_key = normalise_name(last_name)
+
+        season_year = _season_year_from_date(row.get("gameDate"))
+        if season_year is None:
+            continue
+        city = (row.get("playerteamCity") or "").strip()
+        name = (row.get("playerteamName") or "").strip()
+        # The archive splits the team into city + nickname; the catalog may key on either form.
+        for candidate in {city, f"{city} {name}".strip(), name}:
+            team_key = normalise_team(candidate)
+            if team_key:
+                identity.appearances.add((season_year, team_key))
+    return identities
+
+
+def build_blocks(catalog: Iterable[CatalogEntry]) -> Dict[BlockKey, List[CatalogEntry]]:
+    """Index catalog records by team/season, name prefix and phonetic code."""
+
+    blocks: Dict[BlockKey, List[CatalogEntry]] = defaultdict(list)
+    for entry in catalog:
+        for key in _block_keys(entry.name_key, entry.last_key, entry.team_key, entry.season_year):
+            blocks[key].append(entry)
+    return blocks
+
+
+def _name_similarity(left: str, right: str) -> float:
+    if left == right:
+        return 1.0
+    return SequenceMatcher(None, left, right).ratio()
+
+
+def score_identity(
+    identity: ArchiveIdentity, blocks: Dict[BlockKey, List[CatalogEntry]]
+) -> List[Tuple[float, str]]:
+    """Score only the catalog slugs sharing at least one block with ``identity``."""
+
+    candidates: Dict[str, List[CatalogEntry]] = defaultdict(list)
+    seen: Set[BlockKey] = set()
+    for season_year, team_key in identity.appearances:
+        for key in _block_keys(identity.name_key, identity.last_key, team_key, season_year):
+            if key in seen:
+                continue
+            seen.add(key)
+            for entry in blocks.get(key, ()):
+                candidates[entry.slug].append(entry)
+
+    scored: List[Tuple[float, str]] = []
+    for slug, entries in candidates.items():
+        name_score = _name_similarity(identity.name_key, entries[0].name_key)
+        team_score = 1.0 if any(
+            (entry.season_year, entry.team_key) in identity.appearances for entry in entries
+        ) else 0.0
+        scored.append((NAME_WEIGHT * name_score + TEAM_WEIGHT * team_score, slug))
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return scored
+
+
+def match_identities(
+    identities: Iterable[ArchiveIdentity], catalog: Iterable[CatalogEntry]
+) -> List[CrosswalkMatch]:
+    """Resolve each archive identity to at most one slug, keeping slugs one-to-one."""
+
+    blocks = build_blocks(catalog)
+    best_by_slug: Dict[str, CrosswalkMatch] = {}
+    for identity in identities:
+        if not identity.name_key:
+            continue
+        scored = score_identity(identity, blocks)
+        if not scored:
+            continue
+        best_score, best_slug = scored[0]
+        if best_score < MATCH_THRESHOLD:
+            continue
+        if len(scored) > 1 and best_score - scored[1][0] < MATCH_MARGIN:
+            continue
+        current = best_by_slug.get(best_slug)
+        if current is None or best_score > current.score:
+            best_by_slug[best_slug] = CrosswalkMatch(identity.person_id, best_slug, best_score)
+
+    return sorted(best_by_slug.values(), key=lambda match: match.person_id)
+
+
+def main() -> None:
+    # Imported here so the matching helpers stay importable without the archive reader.
+    from scripts.build_insights import (
+        PlayerStatisticsStreamError,
+        iter_player_statistics_rows,
+    )
+
+    catalog = load_catalog()
+    if not catalog:
+        raise SystemExit(f"No catalog players found in {INDEX_PATH.relative_to(ROOT)}")
+
+    try:
+        rows = iter_player_statistics_rows()
+    except PlayerStatisticsStreamError as exc:  # pragma: no cover - defensive guard
+        raise SystemExit(str(exc)) from exc
+
+    identities = collect_archive_identities(rows)
+    matches = match_identities(identities.values(), catalog)
+
+    payload = {
+        "generated": datetime.now(UTC).isoformat(),
+        "archive_identities": len(identities),
+        "catalog_slugs": len({entry.slug for entry in catalog}),
+        "matched": len(matches),
+        "players": {
+            str(match.person_id): {"slug": match.slug, "score": round(match.score, 4)}
+            for match in matches
+        },
+    }
+
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    OUTPUT_PATH.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    print(
+        f"Matched {payload['matched']} of {payload['archive_identities']} archive players; "
+        f"wrote {OUTPUT_PATH.relative_to(ROOT)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import argparse
 import json
 import sys
 from collections import defaultdict
@@ -18,32 +19,44 @@ from scripts.build_insights import (  # noqa: E402
     PlayerStatisticsStreamError,
     iter_player_statistics_rows,
 )
+from scripts.data.row_projection import (  # noqa: E402
+    project_records,
+    season_start_from_date,
+)
+from scripts.data.sampling import (  # noqa: E402
+    add_sample_arguments,
+    apply_sample,
+    preview_metadata,
+    preview_path,
+)
 
 TARGET_SEASON_START = 2024
 OUTPUT_PATH = ROOT / "data" / "2025-26" / "canonical" / "player_scoring_averages.json"
+# Only the columns aggregated below are converted, once each, into a typed tuple.
+SCORING_COLUMNS = (
+    ("personId", "str"),
+    ("numMinutes", "float"),
+    ("points", "float"),
+    ("firstName", "str"),
+    ("lastName", "str"),
+)
 
 
-def _season_start_year(date_str: str | None) -> int | None:
-    if not date_str:
-        return None
-    try:
-        year = int(date_str[0:4])
-        month = int(date_str[5:7])
-    except (ValueError, IndexError):
-        return None
-    return year if month >= 10 else year - 1
+def _is_target_row(row: dict[str, str]) -> bool:
+    game_type = (row.get("gameType") or "").strip().lower()
+    if game_type != "regular season":
+        return False
+    return season_start_from_date(row.get("gameDate")) == TARGET_SEASON_START
 
 
-def _to_float(value: str | None) -> float:
-    if value is None:
-        return 0.0
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return 0.0
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_sample_arguments(parser)
+    return parser.parse_args()
 
 
 def main() -> None:
+    args = parse_args()
     totals: Dict[str, Dict[str, object]] = defaultdict(
         lambda: {"points": 0.0, "games": 0.0, "firstName": "", "lastName": ""}
     )
@@ -54,29 +67,23 @@ def main() -> None:
         # Preserve original cause for debugging (Ruff B904).
         raise SystemExit(str(exc)) from exc
 
-    for row in rows:
-        game_type = (row.get("gameType") or "").strip().lower()
-        if game_type != "regular season":
-            continue
-
-        season_start = _season_start_year((row.get("gameDate") or "").strip())
-        if season_start != TARGET_SEASON_START:
-            continue
-
-        minutes = _to_float(row.get("numMinutes"))
+    # Filter before sampling so previews draw only from the rows the build keeps.
+    kept = apply_sample(rows, args, where=_is_target_row)
+    for person_id, minutes, points, first_name, last_name in project_records(
+        kept, SCORING_COLUMNS
+    ):
         if minutes <= 0:
             continue
 
-        player_id = (row.get("personId") or "").strip()
+        player_id = (person_id or "").strip()
         if not player_id:
             continue
 
-        points = _to_float(row.get("points"))
         bucket = totals[player_id]
         bucket["points"] = float(bucket.get("points", 0.0)) + points
         bucket["games"] = float(bucket.get("games", 0.0)) + 1
-        first_name = (row.get("firstName") or "").strip()
-        last_name = (row.get("lastName") or "").strip()
+        first_name = (first_name or "").strip()
+        last_name = (last_name or "").strip()
         if first_name and not bucket.get("firstName"):
             bucket["firstName"] = first_name
         if last_name and not bucket.get("lastName"):
@@ -113,8 +120,14 @@ def main() -> None:
         "players": players,
     }
 
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    output_path = OUTPUT_PATH
+    preview = preview_metadata(args)
+    if preview is not None:
+        payload["preview"] = preview
+        output_path = preview_path(OUTPUT_PATH)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
 
 
 if __name__ == "__main__":
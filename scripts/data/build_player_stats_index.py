@@ -3,14 +3,17 @@
 
 from __future__ import annotations
 
+import argparse
 import json
 import re
 import sys
+import zipfile
 from collections import Counter
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, Iterator, Tuple
 
 # Compute repository root and enable first-party imports.
 ROOT = Path(__file__).resolve().parents[2]
@@ -20,6 +23,18 @@ from scripts.build_insights import (  # noqa: E402
     PlayerStatisticsStreamError,
     iter_player_statistics_rows,
 )
+from scripts.data.game_context import (  # noqa: E402
+    GameContext,
+    GameContextIndex,
+    iter_rows_with_game_context,
+)
+from scripts.data.row_projection import season_start_from_date  # noqa: E402
+from scripts.data.sampling import (  # noqa: E402
+    add_sample_arguments,
+    apply_sample,
+    preview_metadata,
+    preview_path,
+)
 
 OUTPUT_PATH = ROOT / "public" / "data" / "player_stats.json"
 SEASON_CONFIG_PATH = ROOT / "scripts" / "lib" / "season.ts"
@@ -44,6 +59,8 @@ class PlayerTotals:
     fg3a: float = 0.0
     ftm: float = 0.0
     fta: float = 0.0
+    usage_plays: float = 0.0
+    team_usage_plays: float = 0.0
     team_id: int | None = None
     team_abbr: str | None = None
 
@@ -70,20 +87,6 @@ def _season_start_year(label: str) -> int:
         raise SystemExit(f"Invalid season label: {label}") from exc
 
 
-def _infer_season_start(date_str: str | None) -> int | None:
-    if not date_str:
-        return None
-    text = date_str.strip()
-    if not text:
-        return None
-    # The archive uses ``YYYY-MM-DD HH:MM:SS`` without timezone information.
-    try:
-        parsed = datetime.strptime(text[:19], "%Y-%m-%d %H:%M:%S")
-    except ValueError:
-        return None
-    return parsed.year if parsed.month >= 10 else parsed.year - 1
-
-
 def _parse_number(value: str | None) -> float:
     if value is None:
         return 0.0
@@ -138,37 +141,59 @@ def _load_team_lookup() -> Dict[str, Tuple[int, str]]:
     return lookup
 
 
-def _iter_regular_season_rows(target_start_year: int) -> Iterable[dict[str, str]]:
+def _stream_rows() -> Iterable[dict[str, str]]:
     try:
-        rows = iter_player_statistics_rows()
+        return iter_player_statistics_rows()
     except PlayerStatisticsStreamError as exc:  # pragma: no cover - defensive guard
         raise SystemExit(str(exc)) from exc
 
-    for row in rows:
-        season_start = _infer_season_start(row.get("gameDate"))
-        if season_start != target_start_year:
-            continue
-        game_type = (row.get("gameType") or "").strip().lower()
-        if game_type != "regular season":
-            continue
-        yield row
+
+def _is_regular_season_row(target_start_year: int, row: dict[str, str]) -> bool:
+    if season_start_from_date(row.get("gameDate")) != target_start_year:
+        return False
+    return (row.get("gameType") or "").strip().lower() == "regular season"
+
+
+def _iter_regular_season_rows(
+    target_start_year: int, args: argparse.Namespace
+) -> Iterable[dict[str, str]]:
+    # Filter before sampling so previews draw only from the rows the build keeps.
+    return apply_sample(
+        _stream_rows(), args, where=partial(_is_regular_season_row, target_start_year)
+    )
 
 
 def _season_counts() -> Counter[int]:
     counts: Counter[int] = Counter()
-    try:
-        rows = iter_player_statistics_rows()
-    except PlayerStatisticsStreamError as exc:  # pragma: no cover - defensive guard
-        raise SystemExit(str(exc)) from exc
-
-    for row in rows:
-        season_start = _infer_season_start(row.get("gameDate"))
+    for row in _stream_rows():
+        season_start = season_start_from_date(row.get("gameDate"))
         if season_start is not None:
             counts[season_start] += 1
     return counts
 
 
-def _accumulate(bucket: PlayerTotals, row: dict[str, str], lookup: Dict[str, Tuple[int, str]]) -> None:
+def _load_game_context(season_start: int) -> GameContextIndex | None:
+    try:
+        return GameContextIndex.load(season_start=season_start)
+    except (OSError, ValueError, zipfile.BadZipFile) as exc:
+        print(f"Warning: game context unavailable ({exc}); skipping usage share")
+        return None
+
+
+def _iter_rows_with_context(
+    rows: Iterable[dict[str, str]], index: GameContextIndex | None
+) -> Iterator[Tuple[dict[str, str], GameContext | None]]:
+    if index is None:
+        return ((row, None) for row in rows)
+    return iter_rows_with_game_context(rows, index)
+
+
+def _accumulate(
+    bucket: PlayerTotals,
+    row: dict[str, str],
+    lookup: Dict[str, Tuple[int, str]],
+    context: GameContext | None = None,
+) -> None:
     minutes = _parse_minutes(row.get("numMinutes"))
     if minutes <= 0:
         return
@@ -180,13 +205,21 @@ def _accumulate(bucket: PlayerTotals, row: dict[str, str], lookup: Dict[str, Tup
     bucket.ast += _parse_number(row.get("assists"))
     bucket.stl += _parse_number(row.get("steals"))
     bucket.blk += _parse_number(row.get("blocks"))
-    bucket.tov += _parse_number(row.get("turnovers"))
+    tov = _parse_number(row.get("turnovers"))
+    fga = _parse_number(row.get("fieldGoalsAttempted"))
+    fta = _parse_number(row.get("freeThrowsAttempted"))
+    bucket.tov += tov
     bucket.fgm += _parse_number(row.get("fieldGoalsMade"))
-    bucket.fga += _parse_number(row.get("fieldGoalsAttempted"))
+    bucket.fga += fga
     bucket.fg3m += _parse_number(row.get("threePointersMade"))
     bucket.fg3a += _parse_number(row.get("threePointersAttempted"))
     bucket.ftm += _parse_number(row.get("freeThrowsMade"))
-    bucket.fta += _parse_number(row.get("freeThrowsAttempted"))
+    bucket.fta += fta
+
+    # Share of the team's possession-ending plays in the games this player appeared in.
+    if context is not None and context.team_totals is not None:
+        bucket.usage_plays += fga + 0.44 * fta + tov
+        bucket.team_usage_plays += context.team_totals.usage_plays
 
     team_key = _normalise_team_key(row.get("playerteamCity"), row.get("playerteamName"))
     if team_key and team_key in lookup:
@@ -212,17 +245,49 @@ def _totals_to_average(totals: PlayerTotals) -> dict[str, object]:
         "fg_pct": (totals.fgm / totals.fga) if totals.fga > 0 else None,
         "fg3_pct": (totals.fg3m / totals.fg3a) if totals.fg3a > 0 else None,
         "ft_pct": (totals.ftm / totals.fta) if totals.fta > 0 else None,
+        "usage_share": (
+            totals.usage_plays / totals.team_usage_plays if totals.team_usage_plays > 0 else None
+        ),
     }
 
 
+def _season_label_arg(value: str) -> str:
+    if not re.fullmatch(r"\d{4}-\d{2}", value):
+        raise argparse.ArgumentTypeError(f"expected a season label like 2024-25, got {value!r}")
+    return value
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--season",
+        type=_season_label_arg,
+        default=None,
+        help=(
+            "Season label to build, e.g. 2024-25 (default: scripts/lib/season.ts). Skips the "
+            "archive scan that falls back to the nearest earlier season when the default is missing"
+        ),
+    )
+    add_sample_arguments(parser)
+    return parser.parse_args()
+
+
 def main() -> None:
-    season_label = _load_season_label()
+    args = parse_args()
+    if args.season is not None:
+        season_label = args.season
+        counts = None
+    else:
+        season_label = _load_season_label()
+        if args.sample:
+            # Previews must resolve the season exactly like the full build does.
+            print("Scanning archive seasons; pass --season to skip this for previews")
+        counts = _season_counts()
+        if not counts:
+            raise SystemExit("PlayerStatistics archive does not contain any seasons")
     desired_start = _season_start_year(season_label)
-    counts = _season_counts()
-    if not counts:
-        raise SystemExit("PlayerStatistics archive does not contain any seasons")
 
-    if desired_start in counts:
+    if counts is None or desired_start in counts:
         season_start = desired_start
         season_label_output = season_label
     else:
@@ -247,9 +312,11 @@ def main() -> None:
         season_label_output = season_label
 
     team_lookup = _load_team_lookup()
+    game_context = _load_game_context(season_start)
 
     totals: Dict[int, PlayerTotals] = {}
-    for row in _iter_regular_season_rows(season_start):
+    rows = _iter_regular_season_rows(season_start, args)
+    for row, context in _iter_rows_with_context(rows, game_context):
         player_id_value = row.get("personId")
         try:
             player_id = int(float(player_id_value))  # Handles possible "123.0" entries
@@ -262,7 +329,7 @@ def main() -> None:
         if bucket is None:
             bucket = PlayerTotals(player_id=player_id)
             totals[player_id] = bucket
-        _accumulate(bucket, row, team_lookup)
+        _accumulate(bucket, row, team_lookup, context)
 
     entries = [
         (str(player_id), _totals_to_average(bucket))
@@ -279,9 +346,15 @@ def main() -> None:
         "players": dict(entries),
     }
 
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
-    print(f"Wrote {payload['player_count']} players to {OUTPUT_PATH.relative_to(ROOT)}")
+    output_path = OUTPUT_PATH
+    preview = preview_metadata(args)
+    if preview is not None:
+        payload["preview"] = preview
+        output_path = preview_path(OUTPUT_PATH)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {payload['player_count']} players to {output_path.relative_to(ROOT)}")
 
 
 if __name__ == "__main__":
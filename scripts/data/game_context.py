@@ -0,0 +1,205 @@
+"""Hash-join PlayerStatistics rows against ``Games.csv`` and ``TeamStatistics.zip``.
+
+The game and team tables are small compared to the player archive, so they are
+indexed in memory keyed by ``gameId`` (and team) while player rows stream past.
+Only the columns needed for game context are retained, which keeps the resident
+set proportional to the number of games in scope rather than the archive size.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple
+
+from scripts.data.row_projection import season_start_from_date, to_float, to_int
+
+ROOT = Path(__file__).resolve().parents[2]
+GAMES_PATH = ROOT / "Games.csv"
+TEAM_STATISTICS_PATH = ROOT / "TeamStatistics.zip"
+
+TeamKey = Tuple[str, str]
+
+
+def _team_key(city: str | None, name: str | None) -> str:
+    return f"{(city or '').strip().lower()}::{(name or '').strip().lower()}"
+
+
+@dataclass(frozen=True, slots=True)
+class GameInfo:
+    """Home/away pairing for a single game from ``Games.csv``."""
+
+    game_id: str
+    home_key: str
+    away_key: str
+    home_team_id: int | None
+    away_team_id: int | None
+    home_name: str
+    away_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class TeamTotals:
+    """Team box score totals from ``TeamStatistics`` for one team in one game."""
+
+    team_id: int | None
+    minutes: float
+    points: float
+    fga: float
+    fta: float
+    tov: float
+    reb: float
+    ast: float
+
+    @property
+    def usage_plays(self) -> float:
+        """Possession-ending plays used for usage-share denominators."""
+
+        return self.fga + 0.44 * self.fta + self.tov
+
+
+@dataclass(frozen=True, slots=True)
+class GameContext:
+    """Game-level context attached to a streamed player row."""
+
+    game_id: str
+    is_home: bool
+    team_id: int | None
+    opponent_team_id: int | None
+    opponent: str
+    team_totals: TeamTotals | None
+    opponent_totals: TeamTotals | None
+
+
+class GameContextIndex:
+    """In-memory build side of the player/game hash join."""
+
+    def __init__(
+        self,
+        games: Dict[str, GameInfo] | None = None,
+        team_totals: Dict[TeamKey, TeamTotals] | None = None,
+    ) -> None:
+        self.games: Dict[str, GameInfo] = games or {}
+        self.team_totals: Dict[TeamKey, TeamTotals] = team_totals or {}
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    @classmethod
+    def load(
+        cls,
+        games_path: Path = GAMES_PATH,
+        team_statistics_path: Path = TEAM_STATISTICS_PATH,
+        *,
+        season_start: int | None = None,
+    ) -> "GameContextIndex":
+        """Index the small tables, optionally restricted to a single season."""
+
+        with games_path.open(encoding="utf-8", newline="") as handle:
+            games = _index_games(csv.DictReader(handle), season_start)
+
+        with zipfile.ZipFile(team_statistics_path) as archive:
+            member = next(
+                (name for name in archive.namelist() if name.lower().endswith(".csv")), None
+            )
+            if member is None:
+                raise FileNotFoundError(f"No CSV member found in {team_statistics_path}")
+            with archive.open(member) as raw:
+                handle = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+                team_totals = _index_team_totals(csv.DictReader(handle), games.keys())
+
+        return cls(games, team_totals)
+
+    def lookup(self, row: dict[str, str]) -> GameContext | None:
+        """Probe the index with a PlayerStatistics row."""
+
+        game_id = (row.get("gameId") or "").strip()
+        game = self.games.get(game_id)
+        if game is None:
+            return None
+
+        team_key = _team_key(row.get("playerteamCity"), row.get("playerteamName"))
+        if team_key == game.home_key:
+            is_home = True
+        elif team_key == game.away_key:
+            is_home = False
+        else:
+            # Fall back to the archive's own ``home`` flag when names drift between tables.
+            is_home = (row.get("home") or "").strip().lower() in {"1", "true", "t", "yes"}
+
+        if is_home:
+            own_key, opponent_key = game.home_key, game.away_key
+            team_id, opponent_id, opponent = game.home_team_id, game.away_team_id, game.away_name
+        else:
+            own_key, opponent_key = game.away_key, game.home_key
+            team_id, opponent_id, opponent = game.away_team_id, game.home_team_id, game.home_name
+
+        return GameContext(
+            game_id=game_id,
+            is_home=is_home,
+            team_id=team_id,
+            opponent_team_id=opponent_id,
+            opponent=opponent,
+            team_totals=self.team_totals.get((game_id, own_key)),
+            opponent_totals=self.team_totals.get((game_id, opponent_key)),
+        )
+
+
+def _index_games(rows: Iterable[dict[str, str]], season_start: int | None) -> Dict[str, GameInfo]:
+    games: Dict[str, GameInfo] = {}
+    for row in rows:
+        game_id = (row.get("gameId") or "").strip()
+        if not game_id:
+            continue
+        if season_start is not None and season_start_from_date(row.get("gameDate")) != season_start:
+            continue
+        home_city = (row.get("hometeamCity") or "").strip()
+        home_name = (row.get("hometeamName") or "").strip()
+        away_city = (row.get("awayteamCity") or "").strip()
+        away_name = (row.get("awayteamName") or "").strip()
+        games[game_id] = GameInfo(
+            game_id=game_id,
+            home_key=_team_key(home_city, home_name),
+            away_key=_team_key(away_city, away_name),
+            home_team_id=to_int(row.get("hometeamId")),
+            away_team_id=to_int(row.get("awayteamId")),
+            home_name=f"{home_city} {home_name}".strip(),
+            away_name=f"{away_city} {away_name}".strip(),
+        )
+    return games
+
+
+def _index_team_totals(
+    rows: Iterable[dict[str, str]], game_ids: Iterable[str]
+) -> Dict[TeamKey, TeamTotals]:
+    wanted = set(game_ids)
+    totals: Dict[TeamKey, TeamTotals] = {}
+    for row in rows:
+        game_id = (row.get("gameId") or "").strip()
+        if game_id not in wanted:
+            continue
+        key = (game_id, _team_key(row.get("teamCity"), row.get("teamName")))
+        totals[key] = TeamTotals(
+            team_id=to_int(row.get("teamId")),
+            minutes=to_float(row.get("numMinutes")),
+            points=to_float(row.get("teamScore")),
+            fga=to_float(row.get("fieldGoalsAttempted")),
+            fta=to_float(row.get("freeThrowsAttempted")),
+            tov=to_float(row.get("turnovers")),
+            reb=to_float(row.get("reboundsTotal")),
+            ast=to_float(row.get("assists")),
+        )
+    return totals
+
+
+def iter_rows_with_game_context(
+    rows: Iterable[dict[str, str]], index: GameContextIndex
+) -> Iterator[Tuple[dict[str, str], GameContext | None]]:
+    """Stream player rows through the index, pairing each with its game context."""
+
+    lookup = index.lookup
+    for row in rows:
+        yield row, lookup(row)
@@ -0,0 +1,149 @@
+"""Compiled, typed column projections for PlayerStatistics CSV rows.
+
+Consumers describe the columns they need as ``(column, type)`` pairs. The
+projection is compiled once per CSV header into a single function that indexes
+the raw ``csv.reader`` list and converts each field in place, returning a tuple
+in projection order. No per-row dict is built and unused columns are never
+touched. ``project_records`` applies the same projection to rows that already
+arrive as dicts, such as ``iter_player_statistics_rows()`` output.
+
+Supported types:
+
+* ``str`` – raw field text
+* ``float`` – ``float`` with blanks and junk mapped to ``0.0``
+* ``int`` – ``int`` (accepting ``"12.0"``) with blanks and junk mapped to ``None``
+* ``season`` – season start year derived from a ``YYYY-MM`` date prefix
+"""
+
+from __future__ import annotations
+
+import csv
+from typing import Callable, Iterable, Iterator, Mapping, Sequence, TextIO, Tuple
+
+ColumnSpec = Tuple[str, str]
+Decoder = Callable[[list[str]], tuple]
+RecordDecoder = Callable[[Mapping[str, str]], tuple]
+
+
+class ProjectionError(ValueError):
+    """Raised when a projection names an unknown column or type."""
+
+
+def to_float(value: str | None) -> float:
+    try:
+        return float(value) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+def to_int(value: str | None) -> int | None:
+    if not value:
+        return None
+    # ``str.isdigit`` also accepts non-ASCII digits such as ``"²"`` that ``int`` rejects.
+    if value.isascii() and value.isdigit():
+        return int(value)
+    try:
+        return int(float(value))
+    except (ValueError, OverflowError):
+        return None
+
+
+def season_start_from_date(value: str | None) -> int | None:
+    """Season start year for ``YYYY-MM-DD[ HH:MM:SS]`` text; October starts a season."""
+
+    if not value:
+        return None
+    text = value.lstrip()
+    if len(text) < 7 or text[4] != "-":
+        return None
+    year_text, month_text = text[:4], text[5:7]
+    digits = year_text + month_text
+    # ``str.isdigit`` alone also accepts non-ASCII digits that ``int`` rejects.
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    month = int(month_text)
+    if not 1 <= month <= 12:
+        return None
+    year = int(year_text)
+    return year if month >= 10 else year - 1
+
+
+_CONVERTERS: dict[str, Callable[[str], object] | None] = {
+    "str": None,
+    "float": to_float,
+    "int": to_int,
+    "season": season_start_from_date,
+}
+
+
+def _column_positions(header: Sequence[str]) -> dict[str, int]:
+    return {name.strip(): index for index, name in enumerate(header)}
+
+
+def _compile_decoder(
+    spec: Sequence[ColumnSpec], field_source: Callable[[str], str]
+) -> Callable[..., tuple]:
+    namespace: dict[str, object] = {}
+    terms: list[str] = []
+    for slot, (column, type_name) in enumerate(spec):
+        field = field_source(column)
+        if type_name not in _CONVERTERS:
+            raise ProjectionError(f"Unsupported projection type {type_name!r} for {column!r}")
+        converter = _CONVERTERS[type_name]
+        if converter is None:
+            terms.append(field)
+        else:
+            namespace[f"_c{slot}"] = converter
+            terms.append(f"_c{slot}({field})")
+
+    source = f"def decode(row):\n    return ({', '.join(terms)}{',' if len(terms) == 1 else ''})\n"
+    exec(compile(source, "<row_projection>", "exec"), namespace)  # source is generated from the spec above
+    return namespace["decode"]  # type: ignore[return-value]
+
+
+def compile_projection(header: Sequence[str], spec: Sequence[ColumnSpec]) -> Decoder:
+    """Build a decoder mapping a raw CSV row list to a typed tuple in ``spec`` order."""
+
+    positions = _column_positions(header)
+
+    def field_source(column: str) -> str:
+        if column not in positions:
+            raise ProjectionError(f"Column {column!r} not present in CSV header")
+        return f"row[{positions[column]}]"
+
+    return _compile_decoder(spec, field_source)
+
+
+def compile_record_projection(spec: Sequence[ColumnSpec]) -> RecordDecoder:
+    """Build a decoder mapping a dict row to a typed tuple; missing keys convert as blanks."""
+
+    return _compile_decoder(spec, lambda column: f"row.get({column!r})")
+
+
+def project_records(
+    rows: Iterable[Mapping[str, str]], spec: Sequence[ColumnSpec]
+) -> Iterator[tuple]:
+    """Yield typed tuples for ``spec`` from rows already decoded into dicts."""
+
+    decode = compile_record_projection(spec)
+    for row in rows:
+        yield decode(row)
+
+
+def iter_projected_rows(
+    stream: TextIO | Iterable[str], spec: Sequence[ColumnSpec]
+) -> Iterator[tuple]:
+    """Yield typed tuples for ``spec`` from CSV text whose first line is the header."""
+
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        return
+    decode = compile_projection(header, spec)
+    positions = _column_positions(header)
+    width = max((positions[column] for column, _ in spec), default=-1) + 1
+    for row in reader:
+        # Truncated lines are kept as long as every projected column is present.
+        if len(row) < width:
+            continue
+        yield decode(row)
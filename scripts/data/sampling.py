@@ -0,0 +1,218 @@
+"""Preview sampling for PlayerStatistics consumers.
+
+Development builds rarely need the whole archive to check output shape. Two
+deterministic samplers are provided:
+
+* ``reservoir`` keeps a seeded, uniform sample of ``size`` rows (Algorithm R).
+* ``players`` keeps every row for players whose hashed ``personId`` falls under
+  ``fraction``, so a sampled player's stat line is complete.
+
+``apply_sample`` caps the raw archive stream at ``scan_limit`` rows, applies the
+builder's own row filter (season, game type) and only then samples, so the
+sample is drawn from rows the build would actually use. Once the cap is hit the
+source iterator is closed so the archive reader stops decompressing.
+
+Reservoir sampling is capped at ``DEFAULT_SCAN_LIMIT`` rows unless told
+otherwise. Player sampling scans the whole archive by default so no stat line is
+cut short; that still decompresses and decodes every row and only makes the
+aggregation cheaper, so pass ``--sample-scan`` when a fast preview matters more
+than complete stat lines.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import random
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List
+
+SAMPLE_MODES = ("reservoir", "players")
+DEFAULT_SAMPLE_SIZE = 5000
+DEFAULT_SAMPLE_FRACTION = 0.05
+DEFAULT_SCAN_LIMIT = 250_000
+DEFAULT_SEED = 0
+
+_HASH_SCALE = float(1 << 64)
+
+RowFilter = Callable[[dict[str, str]], bool]
+
+
+def _bounded(rows: Iterable[dict[str, str]], scan_limit: int | None) -> Iterator[dict[str, str]]:
+    iterator = iter(rows)
+    try:
+        if scan_limit:
+            yield from islice(iterator, scan_limit)
+        else:
+            yield from iterator
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+def reservoir_sample(
+    rows: Iterable[dict[str, str]],
+    size: int,
+    *,
+    seed: int = DEFAULT_SEED,
+    scan_limit: int | None = None,
+) -> List[dict[str, str]]:
+    """Return a seeded uniform sample of ``size`` rows in their original stream order."""
+
+    if size <= 0:
+        return []
+    rng = random.Random(seed)
+    reservoir: List[tuple[int, dict[str, str]]] = []
+    for position, row in enumerate(_bounded(rows, scan_limit)):
+        if position < size:
+            reservoir.append((position, row))
+            continue
+        slot = rng.randint(0, position)
+        if slot < size:
+            reservoir[slot] = (position, row)
+    reservoir.sort(key=lambda item: item[0])
+    return [row for _, row in reservoir]
+
+
+def _player_key(value: str | None) -> str:
+    text = (value or "").strip()
+    try:
+        return str(int(float(text)))  # Handles possible "123.0" entries
+    except (ValueError, OverflowError):
+        return text
+
+
+def player_hash(person_id: str | None, seed: int = DEFAULT_SEED) -> float:
+    """Map a ``personId`` to a stable position in ``[0, 1)``."""
+
+    key = f"{seed}:{_player_key(person_id)}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") / _HASH_SCALE
+
+
+def player_sample(
+    rows: Iterable[dict[str, str]],
+    fraction: float,
+    *,
+    seed: int = DEFAULT_SEED,
+    scan_limit: int | None = None,
+) -> Iterator[dict[str, str]]:
+    """Yield every row belonging to the hashed subset of players."""
+
+    if fraction <= 0:
+        return
+    selected: dict[str, bool] = {}
+    for row in _bounded(rows, scan_limit):
+        person_id = row.get("personId") or ""
+        keep = selected.get(person_id)
+        if keep is None:
+            keep = player_hash(person_id, seed) < fraction
+            selected[person_id] = keep
+        if keep:
+            yield row
+
+
+def _scan_count(value: str) -> int:
+    try:
+        count = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid row count: {value!r}") from exc
+    if count < 0:
+        raise argparse.ArgumentTypeError("row count must be zero or positive")
+    return count
+
+
+def add_sample_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the shared ``--sample`` flags on a builder's argument parser."""
+
+    group = parser.add_argument_group("preview sampling")
+    group.add_argument(
+        "--sample",
+        choices=SAMPLE_MODES,
+        default=None,
+        help="Build a preview from a sample of the archive instead of the full stream",
+    )
+    group.add_argument(
+        "--sample-size",
+        type=int,
+        default=DEFAULT_SAMPLE_SIZE,
+        help="Rows kept by --sample reservoir (default: %(default)s)",
+    )
+    group.add_argument(
+        "--sample-fraction",
+        type=float,
+        default=DEFAULT_SAMPLE_FRACTION,
+        help=(
+            "Share of players kept by --sample players (default: %(default)s). Without "
+            "--sample-scan the whole archive is still read, so this mostly saves aggregation time"
+        ),
+    )
+    group.add_argument(
+        "--sample-scan",
+        type=_scan_count,
+        default=None,
+        help=(
+            "Stop reading the archive after this many raw rows; 0 scans everything "
+            f"(default: {DEFAULT_SCAN_LIMIT} for reservoir, unbounded for players)"
+        ),
+    )
+    group.add_argument(
+        "--sample-seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help="Seed for deterministic sampling (default: %(default)s)",
+    )
+
+
+def scan_limit(args: argparse.Namespace) -> int | None:
+    """Effective row cap; player sampling is only capped when asked explicitly."""
+
+    if args.sample_scan is not None:
+        return args.sample_scan or None
+    return DEFAULT_SCAN_LIMIT if args.sample == "reservoir" else None
+
+
+def apply_sample(
+    rows: Iterable[dict[str, str]],
+    args: argparse.Namespace,
+    where: RowFilter | None = None,
+) -> Iterable[dict[str, str]]:
+    """Filter ``rows`` with ``where`` and sample the survivors if ``--sample`` is set.
+
+    The scan cap counts raw archive rows, but the sampler only sees rows passing
+    ``where``, so a preview is not spent on seasons or game types the build drops.
+    """
+
+    if args.sample is None:
+        return rows if where is None else filter(where, rows)
+    candidates: Iterable[dict[str, str]] = _bounded(rows, scan_limit(args))
+    if where is not None:
+        candidates = filter(where, candidates)
+    if args.sample == "reservoir":
+        return reservoir_sample(candidates, args.sample_size, seed=args.sample_seed)
+    return player_sample(candidates, args.sample_fraction, seed=args.sample_seed)
+
+
+def preview_metadata(args: argparse.Namespace) -> dict[str, object] | None:
+    """Describe the sampling used so preview payloads are never mistaken for full builds."""
+
+    if args.sample is None:
+        return None
+    metadata: dict[str, object] = {
+        "mode": args.sample,
+        "seed": args.sample_seed,
+        "limit": scan_limit(args),
+    }
+    if args.sample == "reservoir":
+        metadata["size"] = args.sample_size
+    else:
+        metadata["fraction"] = args.sample_fraction
+    return metadata
+
+
+def preview_path(path: Path) -> Path:
+    """``player_stats.json`` -> ``player_stats.preview.json``."""
+
+    return path.with_name(f"{path.stem}.preview{path.suffix}")
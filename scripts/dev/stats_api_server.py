@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""Serve player, leaderboard and roster views locally as a stand-in for the worker.
+
+The server loads the builders' JSON outputs from ``public/data`` into in-memory
+indexes, answers ``GET``/``HEAD`` requests over asyncio, caches rendered
+responses in an LRU keyed by path and query, honours ``If-None-Match`` with
+``304`` responses and records per-route latency histograms. ``GET /__stats``
+reports the histograms and cache hit rate so hot queries can be spotted before
+they reach production.
+
+Routes:
+
+* ``/v1/players/<slug>``
+* ``/v1/leaders/<metric>?season=2024-25&limit=25``
+* ``/v1/teams/<team_key>/roster?season=2024-25``
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import hashlib
+import json
+import sys
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+# Compute repository root and enable first-party imports.
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from scripts.generate_player_stat_leaderboards import (  # noqa: E402
+    LEADERBOARD_SPECS,
+    METRIC_SHORT_LABELS,
+    PlayerSeason,
+    build_metric_leaders,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8788
+DEFAULT_CACHE_SIZE = 1024
+DATA_DIR = ROOT / "public" / "data"
+
+# Upper bounds (milliseconds) of the latency histogram buckets; the last bucket is open.
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000)
+MAX_REQUEST_LINE = 8192
+
+_STATUS_TEXT = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+
+@dataclass(frozen=True)
+class Response:
+    status: int
+    body: bytes
+    etag: str | None = None
+
+
+def _json_response(status: int, payload: object) -> Response:
+    body = (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+    etag = f'"{hashlib.sha1(body).hexdigest()}"' if status == 200 else None
+    return Response(status, body, etag)
+
+
+def _not_found(message: str) -> Response:
+    return _json_response(404, {"error": message})
+
+
+class ResponseCache:
+    """Least-recently-used cache of ``(route, response)`` pairs."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Tuple[str, Response]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Tuple[str, Response] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Tuple[str, Response]) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def snapshot(self) -> dict[str, object]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": (self.hits / lookups) if lookups else None,
+        }
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles."""
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, elapsed_ms)] += 1
+        self.total += 1
+        self.sum_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the upper bound of the bucket containing the ``fraction`` quantile."""
+
+        if not self.total:
+            return None
+        rank = fraction * self.total
+        running = 0
+        for index, count in enumerate(self.counts):
+            running += count
+            if running >= rank:
+                return self.bounds[index] if index < len(self.bounds) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> dict[str, object]:
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "count": self.total,
+            "meanMs": (self.sum_ms / self.total) if self.total else None,
+            "maxMs": self.max_ms,
+            "p50Ms": self.percentile(0.5),
+            "p95Ms": self.percentile(0.95),
+            "p99Ms": self.percentile(0.99),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+class StatsStore:
+    """In-memory indexes over the players catalog and per-player season files."""
+
+    def __init__(self, data_dir: Path = DATA_DIR) -> None:
+        self.players: Dict[str, dict] = {}
+        self.seasons: Dict[str, List[PlayerSeason]] = defaultdict(list)
+        self.rosters: Dict[Tuple[str, str], List[dict]] = defaultdict(list)
+        self.season_labels: List[str] = []
+        self._load(data_dir)
+
+    @property
+    def default_season(self) -> str | None:
+        return self.season_labels[-1] if self.season_labels else None
+
+    def _load(self, data_dir: Path) -> None:
+        for path in sorted((data_dir / "players").glob("*.json")):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except Exception as exc:  # pragma: no cover - defensive logging
+                raise RuntimeError(f"Failed to parse {path}") from exc
+            slug = data.get("slug", path.stem)
+            self.players[slug] = data
+            for season in data.get("seasons") or []:
+                if not isinstance(season, dict) or not season.get("season"):
+                    continue
+                self.seasons[season["season"]].append(
+                    PlayerSeason(
+                        slug=slug,
+                        name=data.get("name", path.stem.replace("-", " ").title()),
+                        url=data.get("source"),
+                        season=season["season"],
+                        team=season.get("team"),
+                        games=season.get("gp"),
+                        stats=season,
+                    )
+                )
+
+        index_path = data_dir / "players_index.json"
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+        except OSError:
+            index = {}
+        for entry in index.get("players", []):
+            team_key = entry.get("team_key")
+            season = entry.get("season")
+            if team_key and season:
+                self.rosters[(team_key, season)].append(entry)
+        for roster in self.rosters.values():
+            roster.sort(key=lambda item: item.get("name") or "")
+
+        self.season_labels = sorted(set(index.get("seasons") or []) | set(self.seasons))
+
+    def player(self, slug: str) -> Response:
+        data = self.players.get(slug)
+        if data is None:
+            return _not_found(f"Unknown player: {slug}")
+        return _json_response(200, data)
+
+    def leaders(self, metric: str, season: str | None, limit: int | None) -> Response:
+        spec = LEADERBOARD_SPECS.get(metric)
+        if spec is None:
+            return _not_found(f"Unknown metric: {metric}")
+        season = season or self.default_season
+        if season not in self.seasons:
+            return _not_found(f"No player seasons for {season}")
+        leaders = build_metric_leaders(self.seasons[season], spec)
+        if limit is not None:
+            leaders = leaders[:limit]
+        return _json_response(
+            200,
+            {
+                "season": season,
+                "metric": metric,
+                "label": spec.description,
+                "shortLabel": METRIC_SHORT_LABELS.get(metric, metric.upper()),
+                "leaders": leaders,
+            },
+        )
+
+    def roster(self, team_key: str, season: str | None) -> Response:
+        season = season or self.default_season
+        players = self.rosters.get((team_key, season or ""))
+        if not players:
+            return _not_found(f"No roster for {team_key} in {season}")
+        return _json_response(200, {"team_key": team_key, "season": season, "players": players})
+
+
+class StatsApp:
+    """Routes requests to the store through the response cache and latency metrics."""
+
+    def __init__(self, store: StatsStore, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self.store = store
+        self.cache = ResponseCache(cache_size)
+        self.latency: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.queries: Dict[str, int] = defaultdict(int)
+
+    def stats(self) -> dict[str, object]:
+        hot = sorted(self.queries.items(), key=lambda item: (-item[1], item[0]))[:20]
+        return {
+            "cache": self.cache.snapshot(),
+            "routes": {route: hist.snapshot() for route, hist in sorted(self.latency.items())},
+            "hotQueries": [{"query": query, "count": count} for query, count in hot],
+        }
+
+    def _route(self, path: str, params: dict[str, str]) -> Tuple[str, Response]:
+        parts = [unquote(part) for part in path.strip("/").split("/") if part]
+        if parts[:2] == ["v1", "players"] and len(parts) == 3:
+            return "player", self.store.player(parts[2])
+        if parts[:2] == ["v1", "leaders"] and len(parts) == 3:
+            limit_text = params.get("limit")
+            try:
+                limit = int(limit_text) if limit_text else None
+            except ValueError:
+                return "leaders", _json_response(400, {"error": "limit must be an integer"})
+            if limit is not None and limit <= 0:
+                return "leaders", _json_response(400, {"error": "limit must be positive"})
+            return "leaders", self.store.leaders(parts[2], params.get("season"), limit)
+        if parts[:2] == ["v1", "teams"] and len(parts) == 4 and parts[3] == "roster":
+            return "roster", self.store.roster(parts[2], params.get("season"))
+        return "unknown", _not_found(f"No route for {path}")
+
+    def handle(self, target: str, if_none_match: str | None = None) -> Response:
+        """Resolve a request target to a response, timing it under its route."""
+
+        started = time.perf_counter()
+        split = urlsplit(target)
+        if split.path == "/__stats":
+            return _json_response(200, self.stats())
+
+        params = dict(parse_qsl(split.query))
+        key = f"{split.path}?{'&'.join(f'{k}={v}' for k, v in sorted(params.items()))}"
+        self.queries[key] += 1
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            route, response = cached
+            route = f"{route}:cached"
+        else:
+            route, response = self._route(split.path, params)
+            if response.status == 200:
+                self.cache.put(key, (route, response))
+
+        if response.etag and if_none_match and response.etag in {
+            tag.strip() for tag in if_none_match.split(",")
+        }:
+            response = Response(304, b"", response.etag)
+
+        self.latency[route].observe((time.perf_counter() - started) * 1000.0)
+        return response
+
+
+def _encode_response(response: Response, head_only: bool, keep_alive: bool) -> bytes:
+    headers = [
+        f"HTTP/1.1 {response.status} {_STATUS_TEXT.get(response.status, 'OK')}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {0 if response.status == 304 else len(response.body)}",
+        "Cache-Control: no-cache",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if response.etag:
+        headers.append(f"ETag: {response.etag}")
+    head = ("\r\n".join(headers) + "\r\n\r\n").encode("latin-1")
+    if head_only or response.status == 304:
+        return head
+    return head + response.body
+
+
+async def _handle_connection(
+    app: StatsApp, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line or len(request_line) > MAX_REQUEST_LINE:
+                break
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                writer.write(_encode_response(_json_response(400, {"error": "bad request"}), False, False))
+                break
+
+            headers: dict[str, str] = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            connection = headers.get("connection", "").lower()
+            keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+
+            if method not in {"GET", "HEAD"}:
+                response = _json_response(405, {"error": f"{method} not allowed"})
+            else:
+                response = app.handle(target, headers.get("if-none-match"))
+            writer.write(_encode_response(response, method == "HEAD", keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(app: StatsApp, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    server = await asyncio.start_server(
+        lambda reader, writer: _handle_connection(app, reader, writer), host, port
+    )
+    print(f"Serving stats API on http://{host}:{port} (stats at /__stats)")
+    async with server:
+        await server.serve_forever()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to bind (default: %(default)s)")
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        help="Maximum cached responses; 0 disables caching (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=DATA_DIR,
+        help="Directory containing players_index.json and players/*.json",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    store = StatsStore(args.data_dir)
+    print(f"Loaded {len(store.players)} players across {len(store.season_labels)} seasons")
+    app = StatsApp(store, args.cache_size)
+    try:
+        asyncio.run(serve(app, args.host, args.port))
+    except KeyboardInterrupt:
+        print(json.dumps(app.stats(), indent=2))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,158 @@
+"""Unit tests for :mod:`scripts.data.archive_prefetch`."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.data import archive_prefetch
+
+
+def _read_all(produce, **kwargs) -> bytes:
+    buffer, thread = archive_prefetch.run_producer(produce, **kwargs)
+    data = b"".join(buffer.chunks())
+    thread.join()
+    return data
+
+
+def test_stream_reassembles_producer_bytes() -> None:
+    """Queued chunks come back in order without losing bytes."""
+
+    payload = bytes(range(256)) * 50
+
+    def produce(buffer: archive_prefetch.PrefetchBuffer) -> None:
+        for start in range(0, len(payload), 333):
+            buffer.write(payload[start : start + 333])
+
+    assert _read_all(produce, buffer_size=1000, queue_depth=2) == payload
+
+
+def test_write_queues_bytes_without_copying() -> None:
+    """``bytes`` chunks are queued as the same object the producer wrote."""
+
+    chunk = b"abc" * 100
+
+    def produce(buffer: archive_prefetch.PrefetchBuffer) -> None:
+        buffer.write(chunk)
+
+    buffer, thread = archive_prefetch.run_producer(produce, buffer_size=8, queue_depth=1)
+    assert buffer.get() is chunk
+    thread.join()
+
+
+def test_iter_text_lines_handles_split_characters() -> None:
+    """Multi-byte characters and lines split across chunks decode intact."""
+
+    text = "name,team\nJosé,Señores\nZoë,Ça\n"
+    data = text.encode("utf-8")
+    chunks = [data[index : index + 3] for index in range(0, len(data), 3)]
+
+    assert "".join(archive_prefetch.iter_text_lines(chunks)) == text
+    assert list(archive_prefetch.iter_text_lines([b"a\nb"])) == ["a\n", "b"]
+
+
+def test_producer_errors_reach_consumer() -> None:
+    """Decompression failures surface as :class:`ArchivePrefetchError`."""
+
+    def produce(buffer: archive_prefetch.PrefetchBuffer) -> None:
+        buffer.write(b"partial")
+        raise OSError("corrupt block")
+
+    with pytest.raises(archive_prefetch.ArchivePrefetchError, match="corrupt block"):
+        _read_all(produce, buffer_size=4, queue_depth=1)
+
+
+def test_producer_base_exceptions_reach_consumer() -> None:
+    """Non-``Exception`` failures on the producer thread are forwarded too."""
+
+    def produce(buffer: archive_prefetch.PrefetchBuffer) -> None:
+        raise SystemExit("producer exited")
+
+    with pytest.raises(archive_prefetch.ArchivePrefetchError, match="producer exited"):
+        _read_all(produce, buffer_size=4, queue_depth=1)
+
+
+def test_get_does_not_wait_on_dead_producer() -> None:
+    """A consumer stops waiting once the producer thread is gone without finishing."""
+
+    buffer = archive_prefetch.PrefetchBuffer(buffer_size=4, queue_depth=1)
+    buffer.producer = threading.Thread(target=lambda: None)
+    buffer.producer.start()
+    buffer.producer.join()
+
+    with pytest.raises(archive_prefetch.ArchivePrefetchError, match="stopped"):
+        buffer.get()
+
+
+def test_cancel_unblocks_producer_with_full_queue() -> None:
+    """Backpressure blocks the producer until the consumer cancels."""
+
+    written: list[int] = []
+
+    def produce(buffer: archive_prefetch.PrefetchBuffer) -> None:
+        while True:
+            written.append(buffer.write(b"x" * 16))
+
+    buffer, thread = archive_prefetch.run_producer(produce, buffer_size=16, queue_depth=2)
+    assert buffer.get() == b"x" * 16
+    buffer.cancel()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert len(written) <= 5
+
+
+def test_iter_prefetched_csv_rows_reads_7z_member(tmp_path: Path) -> None:
+    """Rows streamed from a 7z archive match ``csv.DictReader`` output."""
+
+    py7zr = pytest.importorskip("py7zr")
+    archive_path = tmp_path / "PlayerStatistics.7z"
+    lines = ["personId,points"] + [f"{index},{index % 40}" for index in range(2000)]
+    with py7zr.SevenZipFile(archive_path, "w") as archive:
+        archive.writestr("\n".join(lines) + "\n", "PlayerStatistics.csv")
+
+    rows = list(
+        archive_prefetch.iter_prefetched_csv_rows(archive_path, buffer_size=512, queue_depth=2)
+    )
+
+    assert len(rows) == 2000
+    assert rows[0] == {"personId": "0", "points": "0"}
+    assert rows[-1] == {"personId": "1999", "points": "39"}
+
+    with pytest.raises(archive_prefetch.ArchivePrefetchError):
+        archive_prefetch.iter_prefetched_csv_rows(archive_path, "Games.csv")
+
+
+def test_unstarted_iterator_holds_no_open_archive(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The member is checked eagerly, but the archive stays closed until rows are read."""
+
+    py7zr = pytest.importorskip("py7zr")
+    archive_path = tmp_path / "PlayerStatistics.7z"
+    with py7zr.SevenZipFile(archive_path, "w") as archive:
+        archive.writestr("personId\n1\n", "PlayerStatistics.csv")
+
+    open_archives: list[object] = []
+
+    class TrackingSevenZipFile(py7zr.SevenZipFile):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            open_archives.append(self)
+
+        def close(self) -> None:
+            open_archives.remove(self)
+            super().close()
+
+    monkeypatch.setattr(archive_prefetch.py7zr, "SevenZipFile", TrackingSevenZipFile)
+
+    rows = archive_prefetch.iter_prefetched_csv_rows(archive_path)
+    assert open_archives == []
+    assert list(rows) == [{"personId": "1"}]
+    assert open_archives == []
+
@@ -0,0 +1,67 @@
+"""Unit tests for :mod:`scripts.data.game_context`."""
+
+from __future__ import annotations
+
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.data import game_context
+
+GAMES_CSV = """gameId,gameDate,hometeamCity,hometeamName,hometeamId,awayteamCity,awayteamName,awayteamId
+100,2024-11-04 19:00:00,Boston,Celtics,2,Atlanta,Hawks,1
+200,2023-11-04 19:00:00,Boston,Celtics,2,Atlanta,Hawks,1
+"""
+
+TEAM_STATISTICS_CSV = """gameId,teamCity,teamName,teamId,teamScore,fieldGoalsAttempted,freeThrowsAttempted,turnovers,reboundsTotal,assists,numMinutes
+100,Boston,Celtics,2,110,80,25,12,44,25,240
+100,Atlanta,Hawks,1,101,90,20,15,40,22,240
+200,Boston,Celtics,2,99,85,10,10,41,20,240
+"""
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> game_context.GameContextIndex:
+    games_path = tmp_path / "Games.csv"
+    games_path.write_text(GAMES_CSV, encoding="utf-8")
+    team_path = tmp_path / "TeamStatistics.zip"
+    with zipfile.ZipFile(team_path, "w") as archive:
+        archive.writestr("TeamStatistics.csv", TEAM_STATISTICS_CSV)
+    return game_context.GameContextIndex.load(games_path, team_path, season_start=2024)
+
+
+def test_load_restricts_build_side_to_season(index: game_context.GameContextIndex) -> None:
+    """Only games (and team totals) from the requested season are indexed."""
+
+    assert set(index.games) == {"100"}
+    assert {game_id for game_id, _ in index.team_totals} == {"100"}
+
+
+def test_lookup_resolves_opponent_and_team_totals(index: game_context.GameContextIndex) -> None:
+    """Player rows pick up home/away, opponent and their team's box score totals."""
+
+    row = {"gameId": "100", "playerteamCity": "Atlanta", "playerteamName": "Hawks"}
+    context = index.lookup(row)
+
+    assert context is not None
+    assert context.is_home is False
+    assert context.team_id == 1
+    assert context.opponent == "Boston Celtics"
+    assert context.team_totals is not None
+    assert context.team_totals.usage_plays == pytest.approx(90 + 0.44 * 20 + 15)
+    assert context.opponent_totals is not None
+    assert context.opponent_totals.points == 110
+
+
+def test_iter_rows_with_game_context_streams_misses(index: game_context.GameContextIndex) -> None:
+    """Rows for games outside the index still stream through with ``None`` context."""
+
+    rows = [{"gameId": "200"}, {"gameId": "100", "playerteamCity": "Boston", "playerteamName": "Celtics"}]
+    paired = list(game_context.iter_rows_with_game_context(rows, index))
+
+    assert paired[0][1] is None
+    assert paired[1][1] is not None and paired[1][1].is_home is True
@@ -0,0 +1,110 @@
+"""Unit tests for :mod:`scripts.data.build_player_crosswalk`."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.data import build_player_crosswalk as crosswalk
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("Aa'reyon Jones", "aareyonjones"),
+        ("Nikola Jokić", "nikolajokic"),
+        ("Gary Trent Jr.", "garytrent"),
+        (None, ""),
+    ],
+)
+def test_normalise_name(raw: str | None, expected: str) -> None:
+    """Names should fold accents, drop suffixes and keep only alphanumerics."""
+
+    assert crosswalk.normalise_name(raw) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("robert", "R163"),
+        ("rupert", "R163"),
+        ("ashcraft", "A261"),
+        ("tymczak", "T522"),
+        ("", ""),
+    ],
+)
+def test_soundex(raw: str, expected: str) -> None:
+    """``soundex`` follows the American Soundex rules."""
+
+    assert crosswalk.soundex(raw) == expected
+
+
+def _entry(slug: str, name: str, team: str, season_year: int = 2025) -> crosswalk.CatalogEntry:
+    entry = crosswalk._catalog_entry(slug, name, team, season_year)
+    assert entry is not None
+    return entry
+
+
+def test_collect_archive_identities_tracks_team_seasons() -> None:
+    """Rows collapse to one identity per ``personId`` with season-year team keys."""
+
+    rows = [
+        {
+            "personId": "7.0",
+            "firstName": "Aaron",
+            "lastName": "Bradshaw",
+            "gameDate": "2024-11-04 19:00:00",
+            "playerteamCity": "Ohio State",
+            "playerteamName": "Buckeyes",
+        },
+        {"personId": "", "firstName": "Nobody"},
+        {"personId": "inf", "firstName": "Infinite"},
+    ]
+    identities = crosswalk.collect_archive_identities(rows)
+
+    assert list(identities) == [7]
+    identity = identities[7]
+    assert identity.name_key == "aaronbradshaw"
+    assert (2025, "ohiostate") in identity.appearances
+    assert (2025, "ohiostatebuckeyes") in identity.appearances
+
+
+def test_match_identities_prefers_team_block_and_skips_ambiguous() -> None:
+    """Matches need a confident, unambiguous score within a shared block."""
+
+    catalog = [
+        _entry("aaron-davis-4", "Aaron Davis", "Bryant"),
+        _entry("aaron-davis-5", "Aaron Davis", "Akron"),
+        _entry("aaron-cooley-1", "Aaron Cooley", "Brown"),
+    ]
+    bryant = crosswalk.ArchiveIdentity(
+        person_id=1, name_key="aarondavis", last_key="davis", appearances={(2025, "bryant")}
+    )
+    unknown_team = crosswalk.ArchiveIdentity(
+        person_id=2, name_key="aarondavis", last_key="davis", appearances={(2025, "duke")}
+    )
+    cooley = crosswalk.ArchiveIdentity(
+        person_id=3, name_key="aaroncooly", last_key="cooly", appearances={(2025, "brown")}
+    )
+
+    matches = crosswalk.match_identities([bryant, unknown_team, cooley], catalog)
+
+    assert [(match.person_id, match.slug) for match in matches] == [
+        (1, "aaron-davis-4"),
+        (3, "aaron-cooley-1"),
+    ]
+
+
+def test_score_identity_only_scores_shared_blocks() -> None:
+    """Catalog entries from other seasons never reach the scorer."""
+
+    catalog = [_entry("aaron-gray-2", "Aaron Gray", "Indiana State", season_year=2020)]
+    identity = crosswalk.ArchiveIdentity(
+        person_id=9, name_key="aarongray", last_key="gray", appearances={(2025, "indianastate")}
+    )
+
+    assert crosswalk.score_identity(identity, crosswalk.build_blocks(catalog)) == []
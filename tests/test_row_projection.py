@@ -0,0 +1,114 @@
+"""Unit tests for :mod:`scripts.data.row_projection`."""
+
+from __future__ import annotations
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.data import row_projection
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("2024-10-22 19:30:00", 2024),
+        ("2025-03-01", 2024),
+        (" 2024-11-04", 2024),
+        ("2024-1", None),
+        ("", None),
+        (None, None),
+        ("not-a-date", None),
+        ("\u00b2024-10-01 19:00:00", None),
+        ("2024-1\u00b2-01", None),
+        ("2024-00-01", None),
+        ("2024-13-01", None),
+        ("2024-99-01", None),
+        ("2024-12-31", 2024),
+    ],
+)
+def test_season_start_from_date(raw: str | None, expected: int | None) -> None:
+    """Season starts come from the ``YYYY-MM`` prefix with October as the cutover."""
+
+    assert row_projection.season_start_from_date(raw) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("12", 12),
+        ("12.0", 12),
+        ("", None),
+        (None, None),
+        ("abc", None),
+        ("\u00b2", None),
+        ("inf", None),
+    ],
+)
+def test_to_int(raw: str | None, expected: int | None) -> None:
+    """``to_int`` accepts float-formatted ids and maps junk to ``None``."""
+
+    assert row_projection.to_int(raw) == expected
+
+
+def test_iter_projected_rows_returns_typed_tuples() -> None:
+    """Only projected columns are returned, converted and in projection order.
+
+    Rows missing unprojected trailing columns are kept; rows missing a projected one are not.
+    """
+
+    text = (
+        "firstName,personId,gameDate,points,numMinutes\n"
+        "Ann,7.0,2024-11-04 19:00:00,21,31.5\n"
+        "Bo,8,2025-02-01 19:00:00,,\n"
+        "Cy,9,2025-03-01 19:00:00,5\n"
+        "short,row\n"
+    )
+    spec = [
+        ("personId", "int"),
+        ("gameDate", "season"),
+        ("points", "float"),
+        ("firstName", "str"),
+    ]
+
+    rows = list(row_projection.iter_projected_rows(io.StringIO(text), spec))
+
+    assert rows == [(7, 2024, 21.0, "Ann"), (8, 2024, 0.0, "Bo"), (9, 2024, 5.0, "Cy")]
+
+
+def test_single_column_projection_is_a_tuple() -> None:
+    """A one-column projection still yields one-element tuples."""
+
+    decode = row_projection.compile_projection(["a", "b"], [("b", "float")])
+
+    assert decode(["x", "2.5"]) == (2.5,)
+
+
+def test_compile_projection_rejects_unknown_columns_and_types() -> None:
+    """Schema mistakes surface when the projection is compiled, not per row."""
+
+    with pytest.raises(row_projection.ProjectionError, match="missing"):
+        row_projection.compile_projection(["a"], [("missing", "str")])
+    with pytest.raises(row_projection.ProjectionError, match="decimal"):
+        row_projection.compile_projection(["a"], [("a", "decimal")])
+    with pytest.raises(row_projection.ProjectionError, match="decimal"):
+        row_projection.compile_record_projection([("a", "decimal")])
+
+
+def test_project_records_converts_dict_rows() -> None:
+    """Dict rows project like CSV rows; missing keys convert as blanks."""
+
+    rows = [
+        {"personId": "7", "gameDate": "2024-11-04", "points": "21", "extra": "ignored"},
+        {"personId": "8.0", "points": "x"},
+    ]
+    spec = [("points", "float"), ("gameDate", "season"), ("personId", "int"), ("name", "str")]
+
+    assert list(row_projection.project_records(rows, spec)) == [
+        (21.0, 2024, 7, None),
+        (0.0, None, 8, None),
+    ]
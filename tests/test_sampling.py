@@ -0,0 +1,118 @@
+"""Unit tests for :mod:`scripts.data.sampling`."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.data import sampling
+
+
+def _rows(count: int, players: int = 10) -> list[dict[str, str]]:
+    return [{"personId": str(index % players), "points": str(index)} for index in range(count)]
+
+
+def test_reservoir_sample_is_seeded_and_ordered() -> None:
+    """The same seed yields the same sample, returned in stream order."""
+
+    first = sampling.reservoir_sample(_rows(1000), 25, seed=7)
+    second = sampling.reservoir_sample(_rows(1000), 25, seed=7)
+
+    assert first == second
+    assert len(first) == 25
+    positions = [int(row["points"]) for row in first]
+    assert positions == sorted(positions)
+
+
+def test_scan_limit_stops_and_closes_source() -> None:
+    """Sampling stops reading after ``scan_limit`` rows and closes the generator."""
+
+    consumed: list[int] = []
+    closed: list[bool] = []
+
+    def source():
+        try:
+            for row in _rows(1000):
+                consumed.append(1)
+                yield row
+        finally:
+            closed.append(True)
+
+    sample = sampling.reservoir_sample(source(), 5, scan_limit=50)
+
+    assert len(sample) == 5
+    assert len(consumed) == 50
+    assert closed == [True]
+
+
+def test_player_sample_keeps_whole_stat_lines() -> None:
+    """Every row of a selected player survives; unselected players vanish entirely."""
+
+    rows = _rows(500, players=50)
+    sample = list(sampling.player_sample(rows, 0.3, seed=3))
+    kept = {row["personId"] for row in sample}
+
+    assert kept
+    for person_id in kept:
+        assert sum(row["personId"] == person_id for row in sample) == 10
+    assert sampling.player_hash("12.0", seed=3) == sampling.player_hash("12", seed=3)
+    assert 0 <= sampling.player_hash("inf") < 1
+
+
+def test_apply_sample_filters_before_sampling() -> None:
+    """The reservoir only holds rows passing ``where``; the scan cap counts raw rows."""
+
+    parser = argparse.ArgumentParser()
+    sampling.add_sample_arguments(parser)
+    args = parser.parse_args(["--sample", "reservoir", "--sample-size", "5", "--sample-scan", "100"])
+
+    def is_even(row: dict[str, str]) -> bool:
+        return int(row["points"]) % 2 == 0
+
+    sample = list(sampling.apply_sample(_rows(1000), args, where=is_even))
+
+    assert len(sample) == 5
+    assert all(is_even(row) for row in sample)
+    assert max(int(row["points"]) for row in sample) < 100
+
+    full = parser.parse_args([])
+    assert len(list(sampling.apply_sample(_rows(10), full, where=is_even))) == 5
+
+
+def test_sample_scan_rejects_negative_counts() -> None:
+    """Negative scan caps are argparse errors rather than ``islice`` tracebacks."""
+
+    parser = argparse.ArgumentParser()
+    sampling.add_sample_arguments(parser)
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--sample", "reservoir", "--sample-scan", "-1"])
+
+
+def test_preview_metadata_and_path() -> None:
+    """Preview builds are tagged and written beside, not over, the full output."""
+
+    parser = argparse.ArgumentParser()
+    sampling.add_sample_arguments(parser)
+
+    assert sampling.preview_metadata(parser.parse_args([])) is None
+    args = parser.parse_args(["--sample", "players", "--sample-fraction", "0.1"])
+    assert sampling.preview_metadata(args) == {
+        "mode": "players",
+        "seed": 0,
+        "limit": None,
+        "fraction": 0.1,
+    }
+    assert sampling.scan_limit(parser.parse_args(["--sample", "reservoir"])) == (
+        sampling.DEFAULT_SCAN_LIMIT
+    )
+    assert sampling.scan_limit(parser.parse_args(["--sample", "players", "--sample-scan", "10"])) == 10
+    assert sampling.scan_limit(parser.parse_args(["--sample", "reservoir", "--sample-scan", "0"])) is None
+    assert sampling.preview_path(Path("data/player_stats.json")) == Path(
+        "data/player_stats.preview.json"
+    )
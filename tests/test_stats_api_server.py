@@ -0,0 +1,111 @@
+"""Unit tests for :mod:`scripts.dev.stats_api_server`."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.dev import stats_api_server as server
+
+
+@pytest.fixture
+def app(tmp_path: Path) -> server.StatsApp:
+    players_dir = tmp_path / "players"
+    players_dir.mkdir()
+    for slug, name, pts in [("ann-lee-1", "Ann Lee", 21.5), ("bo-diaz-1", "Bo Diaz", 14.0)]:
+        payload = {
+            "slug": slug,
+            "name": name,
+            "seasons": [{"season": "2024-25", "team": "Brown", "gp": 20, "pts_g": pts}],
+        }
+        (players_dir / f"{slug}.json").write_text(json.dumps(payload), encoding="utf-8")
+    index = {
+        "seasons": ["2024-25"],
+        "players": [
+            {"name": "Bo Diaz", "slug": "bo-diaz-1", "season": "2024-25", "team_key": "brown"},
+            {"name": "Ann Lee", "slug": "ann-lee-1", "season": "2024-25", "team_key": "brown"},
+        ],
+    }
+    (tmp_path / "players_index.json").write_text(json.dumps(index), encoding="utf-8")
+    return server.StatsApp(server.StatsStore(tmp_path), cache_size=2)
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    """The oldest untouched entry is dropped once the cache is full."""
+
+    cache = server.ResponseCache(maxsize=2)
+    response = server.Response(200, b"{}")
+    cache.put("a", ("player", response))
+    cache.put("b", ("player", response))
+    assert cache.get("a") is not None
+    cache.put("c", ("player", response))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.snapshot()["hits"] == 2
+
+
+def test_latency_histogram_percentiles() -> None:
+    """Percentiles resolve to the containing bucket's upper bound."""
+
+    histogram = server.LatencyHistogram((1, 10))
+    for elapsed in [0.5, 0.7, 5.0, 50.0]:
+        histogram.observe(elapsed)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.percentile(0.5) == 1
+    assert histogram.percentile(0.99) == 50.0
+
+
+def test_routes_cache_and_etag(app: server.StatsApp) -> None:
+    """Views are served from the indexes, cached, and revalidated with ETags."""
+
+    leaders = app.handle("/v1/leaders/points?limit=1")
+    assert leaders.status == 200
+    body = json.loads(leaders.body)
+    assert [leader["slug"] for leader in body["leaders"]] == ["ann-lee-1"]
+
+    roster = json.loads(app.handle("/v1/teams/brown/roster").body)
+    assert [player["name"] for player in roster["players"]] == ["Ann Lee", "Bo Diaz"]
+
+    revalidated = app.handle("/v1/leaders/points?limit=1", if_none_match=leaders.etag)
+    assert revalidated.status == 304
+    assert app.cache.hits == 1
+    assert app.handle("/v1/players/missing").status == 404
+    for limit in ("-1", "0", "x"):
+        assert app.handle(f"/v1/leaders/points?limit={limit}").status == 400
+    assert set(app.stats()["routes"]) == {"leaders", "leaders:cached", "player", "roster"}
+
+
+def test_serves_http_over_asyncio(app: server.StatsApp) -> None:
+    """A keep-alive connection receives a full response followed by a 304."""
+
+    async def exchange() -> bytes:
+        srv = await asyncio.start_server(
+            lambda reader, writer: server._handle_connection(app, reader, writer), "127.0.0.1", 0
+        )
+        port = srv.sockets[0].getsockname()[1]
+        async with srv:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            etag = app.handle("/v1/players/ann-lee-1").etag
+            writer.write(b"GET /v1/players/ann-lee-1 HTTP/1.1\r\nHost: x\r\n\r\n")
+            writer.write(
+                f"GET /v1/players/ann-lee-1 HTTP/1.1\r\nIf-None-Match: {etag}\r\n"
+                "Connection: close\r\n\r\n".encode("latin-1")
+            )
+            await writer.drain()
+            data = await reader.read()
+            writer.close()
+            return data
+
+    data = asyncio.run(exchange())
+
+    assert data.startswith(b"HTTP/1.1 200 OK")
+    assert b'"name":"Ann Lee"' in data
+    assert b"HTTP/1.1 304 Not Modified" in data